@@ -1,112 +1,378 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import openai
+from openai import AsyncOpenAI, NOT_GIVEN
+import asyncio
+import threading
+import httpx
 import os
-from amadeus import Client, ResponseError
-from dateutil import parser
+import time
+from tenacity import retry, retry_if_exception, retry_if_exception_type, stop_after_attempt, wait_exponential
+from datetime import datetime
 import json
+import functools
 import tkinter.font as tkFont
 import airportsdata
+from concurrent.futures import ThreadPoolExecutor
+
+# One OpenAI client for the whole app so its keep-alive connections get reused.
+# The SDK's own retries are off (openai_retry is the only retry layer) and the
+# timeout is explicit (30s per read), so a stuck call fails fast instead of after the 600s default.
+openai_client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY", "your open api key"),
+    http_client=httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=10)),
+    max_retries=0,
+    timeout=httpx.Timeout(30.0, connect=5.0),
+)
+
+def is_transient_amadeus_error(err):
+    """
+    True for Amadeus errors worth retrying: network failures, 5xx, and 429 rate limits.
+    """
+    if isinstance(err, httpx.TransportError):
+        return True
+    return isinstance(err, httpx.HTTPStatusError) and (
+        err.response.status_code == 429 or err.response.status_code >= 500
+    )
+
+# Up to 3 attempts with exponential backoff on transient failures; the last error is re-raised
+openai_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError)),
+    reraise=True,
+)
+amadeus_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    retry=retry_if_exception(is_transient_amadeus_error),
+    reraise=True,
+)
 
-openai.api_key = os.getenv("OPENAI_API_KEY", "your open api key")
-amadeus = Client(
-    client_id=os.getenv("AMADEUS_CLIENT_ID", "your amadeus client id"),
-    client_secret=os.getenv("AMADEUS_CLIENT_SECRET", "your amadeus client secret")
+# Event loop for all GPT calls, running on a daemon thread alongside Tk's mainloop
+LOOP = asyncio.new_event_loop()
+threading.Thread(target=LOOP.run_forever, daemon=True).start()
+
+# Amadeus REST API, called directly over one keep-alive httpx client.
+# Test-environment flight searches can take several seconds, so the read timeout
+# is well above httpx's 5s default.
+AMADEUS_BASE_URL = "https://test.api.amadeus.com"
+AMADEUS_CLIENT_ID = os.getenv("AMADEUS_CLIENT_ID", "your amadeus client id")
+AMADEUS_CLIENT_SECRET = os.getenv("AMADEUS_CLIENT_SECRET", "your amadeus client secret")
+amadeus_http = httpx.Client(
+    base_url=AMADEUS_BASE_URL,
+    limits=httpx.Limits(max_keepalive_connections=10),
+    timeout=httpx.Timeout(30.0, connect=5.0),
 )
-airports_db = airportsdata.load("IATA")  # Dictionary keyed by uppercase IATA codes
-iata_cache = {}                          # For caching lookups
+amadeus_token = {"access_token": None, "expires_at": 0.0}
+amadeus_token_lock = threading.Lock()
+
+def amadeus_json(response, key):
+    """
+    response.json()[key], raising httpx.DecodingError (an httpx.HTTPError) if the
+    body isn't JSON or lacks 'key', so callers' HTTPError handlers cover it.
+    """
+    try:
+        return response.json()[key]
+    except (ValueError, KeyError, TypeError) as err:
+        raise httpx.DecodingError(
+            f"Unexpected Amadeus response from {response.request.url}: {err!r}",
+            request=response.request,
+        ) from err
+
+def get_amadeus_token():
+    """
+    OAuth2 access token for Amadeus. Fetched on first use and reused until a minute
+    before it expires (Amadeus tokens last about 30 minutes), then refreshed.
+    """
+    with amadeus_token_lock:
+        if time.monotonic() >= amadeus_token["expires_at"]:
+            response = amadeus_http.post(
+                "/v1/security/oauth2/token",
+                data={
+                    "grant_type": "client_credentials",
+                    "client_id": AMADEUS_CLIENT_ID,
+                    "client_secret": AMADEUS_CLIENT_SECRET,
+                },
+            )
+            response.raise_for_status()
+            access_token = amadeus_json(response, "access_token")
+            expires_in = response.json().get("expires_in", 1799)
+            amadeus_token["access_token"] = access_token
+            amadeus_token["expires_at"] = time.monotonic() + expires_in - 60
+        return amadeus_token["access_token"]
+
+def amadeus_get(path, params):
+    """
+    Authenticated GET against the Amadeus API. Returns the response's 'data' list.
+    Raises httpx.HTTPError on network failures, non-2xx and malformed responses.
+    """
+    response = amadeus_http.get(
+        path,
+        params=params,
+        headers={"Authorization": f"Bearer {get_amadeus_token()}"},
+    )
+    response.raise_for_status()
+    return amadeus_json(response, "data")
+
+@functools.cache
+def _airports_db():
+    """
+    airportsdata records keyed by uppercase IATA code, loaded on first use
+    so the ~9000-record load doesn't slow down app startup.
+    """
+    return airportsdata.load("IATA")
+
+# Popular destinations resolved locally so get_iata_code can skip the Amadeus round trip.
+# Multi-airport cities map to their IATA metropolitan-area code (e.g. 'LON' covers LHR,
+# LGW, STN...), which is what Amadeus returns for them and what flight search accepts.
+# airportsdata can't be used for this: it has no airport size, lists closed airports
+# (TXL), and files major hubs under suburbs (YYZ is in "Mississauga").
+# Anything else, including ambiguous names like "Valencia", goes to Amadeus.
+CITY_TO_IATA = {
+    "amsterdam": "AMS",
+    "atlanta": "ATL",
+    "bangkok": "BKK",
+    "barcelona": "BCN",
+    "berlin": "BER",
+    "boston": "BOS",
+    "buenos aires": "BUE",
+    "cancun": "CUN",
+    "chicago": "CHI",
+    "dallas": "DFW",
+    "denver": "DEN",
+    "dubai": "DXB",
+    "dublin": "DUB",
+    "frankfurt": "FRA",
+    "hong kong": "HKG",
+    "honolulu": "HNL",
+    "houston": "HOU",
+    "istanbul": "IST",
+    "las vegas": "LAS",
+    "lisbon": "LIS",
+    "london": "LON",
+    "los angeles": "LAX",
+    "madrid": "MAD",
+    "melbourne": "MEL",
+    "mexico city": "MEX",
+    "miami": "MIA",
+    "milan": "MIL",
+    "montreal": "YMQ",
+    "munich": "MUC",
+    "new york": "NYC",
+    "orlando": "MCO",
+    "osaka": "OSA",
+    "paris": "PAR",
+    "philadelphia": "PHL",
+    "phoenix": "PHX",
+    "prague": "PRG",
+    "rome": "ROM",
+    "san diego": "SAN",
+    "san francisco": "SFO",
+    "sao paulo": "SAO",
+    "seattle": "SEA",
+    "seoul": "SEL",
+    "singapore": "SIN",
+    "stockholm": "STO",
+    "sydney": "SYD",
+    "tokyo": "TYO",
+    "toronto": "YTO",
+    "vancouver": "YVR",
+    "vienna": "VIE",
+    "washington": "WAS",
+    "zurich": "ZRH",
+}
 
 def fix_city_case(city_name):
     """
-    If city_name minus spaces is all uppercase, convert to .title().
+    If city_name is all uppercase, convert to .title().
     E.g. "CHICAGO" -> "Chicago", "SAN DIEGO" -> "San Diego"
     """
-    stripped = city_name.replace(" ", "")
-    if stripped.isupper():
+    # str.isupper already ignores spaces and other uncased characters
+    if city_name.isupper():
         return city_name.title()
     return city_name
 
+iata_to_city_lock = threading.Lock()
+
+@functools.cache
+def _build_iata_to_city():
+    return {
+        code: fix_city_case(record.get('city') or record.get('name', code))
+        for code, record in _airports_db().items()
+    }
+
+def _iata_to_city():
+    """
+    Final display name for every known IATA code, e.g. 'SAN' -> 'San Diego'.
+    Built on first use; the lock keeps concurrent workers from loading airportsdata twice.
+    """
+    with iata_to_city_lock:
+        return _build_iata_to_city()
+
 def iata_to_city_name(iata_code):
     """
     Convert an IATA code (e.g. 'SAN') to a city name (e.g. 'San Diego')
-    using the airportsdata library. Caches results to avoid repeated lookups.
+    using the mapping built once from airportsdata.
     If not found, fallback to the code itself.
     """
     code_upper = iata_code.upper()
-    if code_upper in iata_cache:
-        return iata_cache[code_upper]
+    return _iata_to_city().get(code_upper, code_upper)
 
-    record = airports_db.get(code_upper)
-    if record:
-        # Usually record has: { 'iata': 'SAN', 'city': 'San Diego', 'name': ... }
-        city = record.get('city') or record.get('name', code_upper)
-    else:
-        city = code_upper
-
-    final_city = fix_city_case(city)
-    iata_cache[code_upper] = final_city
-    return final_city
+@openai_retry
+async def create_chat_completion(prompt, max_tokens=700, stream=False, response_format=NOT_GIVEN):
+    """
+    Single GPT chat completion, retried on rate limits, timeouts and server errors.
+    With stream=True the returned object is an async iterator of chunks.
+    """
+    return await openai_client.chat.completions.create(
+        model="gpt-4o",
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    "You are a helpful AI travel assistant. Flights come from Amadeus real-time data. "
+                    "Hotels are recommended based on user city and budget. Provide short, creative suggestions."
+                )
+            },
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=max_tokens,
+        temperature=0.7,
+        stream=stream,
+        response_format=response_format,
+    )
 
-def ask_openai(prompt):
+async def ask_openai_async(prompt, max_tokens=700, stream_cb=None):
     """
-    Send a prompt to GPT and return its response text.
+    Send a prompt to GPT and return its response text, capped at max_tokens.
+    If stream_cb is given, the response is streamed and stream_cb(text) is called
+    with each piece as it arrives (on LOOP's thread); the full text is still returned.
     """
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4o", 
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a helpful AI travel assistant. Flights come from Amadeus real-time data. "
-                        "Hotels are recommended based on user city and budget. Provide short, creative suggestions."
-                    )
-                },
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=700,
-            temperature=0.7,
-        )
-        return response["choices"][0]["message"]["content"]
+        if stream_cb is None:
+            response = await create_chat_completion(prompt, max_tokens)
+            return response.choices[0].message.content
+
+        pieces = []
+        stream = await create_chat_completion(prompt, max_tokens, stream=True)
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                pieces.append(delta)
+                stream_cb(delta)
+        return "".join(pieces)
     except Exception as e:
         return f"An error occurred while calling OpenAI API: {e}"
 
+def ask_openai(prompt, max_tokens=700, stream_cb=None):
+    """
+    Blocking wrapper around ask_openai_async that runs it on LOOP.
+    """
+    coro = ask_openai_async(prompt, max_tokens, stream_cb)
+    return asyncio.run_coroutine_threadsafe(coro, LOOP).result()
+
+async def ask_openai_json_async(prompt, max_tokens, response_format):
+    """
+    Structured-output GPT call (see json_schema_format). Returns the parsed JSON reply,
+    or None after printing why: API error, reply cut off at max_tokens, or invalid JSON.
+    """
+    try:
+        response = await create_chat_completion(prompt, max_tokens, response_format=response_format)
+    except Exception as e:
+        print(f"An error occurred while calling OpenAI API: {e}")
+        return None
+
+    choice = response.choices[0]
+    if choice.finish_reason == "length":
+        # A truncated strict-schema reply is never valid JSON, so don't try to parse it
+        print(f"GPT reply was cut off at max_tokens={max_tokens}.")
+        return None
+    try:
+        return json.loads(choice.message.content)
+    except Exception as e:
+        print("Failed to parse GPT reply as JSON:", e)
+        print("GPT Response was:", choice.message.content)
+        return None
+
+def ask_openai_json(prompt, max_tokens, response_format):
+    """
+    Blocking wrapper around ask_openai_json_async that runs it on LOOP.
+    """
+    coro = ask_openai_json_async(prompt, max_tokens, response_format)
+    return asyncio.run_coroutine_threadsafe(coro, LOOP).result()
+
+@functools.lru_cache(maxsize=512)
+@amadeus_retry
+def _lookup_iata_code(city_key):
+    """
+    Amadeus lookup behind get_iata_code, cached on the normalized city key.
+    httpx.HTTPError propagates so failed lookups are not cached.
+    """
+    data = amadeus_get("/v1/reference-data/locations", {
+        "keyword": city_key,
+        "subType": "AIRPORT,CITY",
+    })
+    if not data:
+        return None
+    return data[0]['iataCode']
+
 def get_iata_code(city_query):
     """
-    Convert a city/airport name (e.g. 'Chicago') to an IATA code (e.g. 'ORD').
+    Convert a city/airport name (e.g. 'San Diego') to an IATA code (e.g. 'SAN').
+    Tries the CITY_TO_IATA table first and only asks Amadeus on a miss.
     """
+    city_key = city_query.strip().lower()
+    code = CITY_TO_IATA.get(city_key)
+    if code:
+        return code
     try:
-        response = amadeus.reference_data.locations.get(
-            keyword=city_query,
-            subType='AIRPORT,CITY',
-        )
-        data = response.data
-        if not data:
-            return None
-        return data[0]['iataCode']  
-    except ResponseError as err:
+        return _lookup_iata_code(city_key)
+    except httpx.HTTPError as err:
         print(f"Error in get_iata_code: {err}")
         return None
 
+@amadeus_retry
+def _search_flight_offers(origin_iata, destination_iata, departure_date, return_date, adults):
+    """
+    Amadeus flight search behind get_flights, retried on transient errors.
+    """
+    return amadeus_get("/v2/shopping/flight-offers", {
+        "originLocationCode": origin_iata,
+        "destinationLocationCode": destination_iata,
+        "departureDate": departure_date,
+        "returnDate": return_date,
+        "adults": adults,
+        "currencyCode": "USD",
+        "max": 1,
+    })
+
 def get_flights(origin_iata, destination_iata, departure_date, return_date, adults=1):
     """
     Fetch exactly ONE flight offer from Amadeus.
     """
     try:
-        response = amadeus.shopping.flight_offers_search.get(
-            originLocationCode=origin_iata,
-            destinationLocationCode=destination_iata,
-            departureDate=departure_date,
-            returnDate=return_date,
-            adults=adults,
-            currencyCode='USD',
-            max=1
-        )
-        return response.data
-    except ResponseError as err:
+        return _search_flight_offers(origin_iata, destination_iata, departure_date, return_date, adults)
+    except httpx.HTTPError as err:
         print(f"Error in get_flights: {err}")
         return []
 
+FLIGHT_HEADER_TEMPLATE = (
+    "Flight detail\n"
+    "Total Price (per adult): ${total_price}\n"
+)
+
+SEGMENT_TEMPLATE = (
+    "Segment {idx}:\n"
+    "  From: {dep_city} ({dep_code})\n"
+    "  Date: {dep_dt:%B %d, %Y}\n"
+    "  Time: {dep_dt:%I:%M %p}\n"
+    "\n"
+    "  To: {arr_city} ({arr_code})\n"
+    "  Date: {arr_dt:%B %d, %Y}\n"
+    "  Time: {arr_dt:%I:%M %p}\n"
+)
+
 def parse_single_flight_offer(flight_offers):
     """
     Nicely format flight data: price, segments, etc.
@@ -118,45 +384,63 @@ def parse_single_flight_offer(flight_offers):
     offer = flight_offers[0]
     total_price = offer['price']['total']
 
-    summary_lines = []
-    summary_lines.append("Flight detail")
-    summary_lines.append(f"Total Price (per adult): ${total_price}\n")
-
     itineraries = offer.get('itineraries', [])
-    segment_counter = 1
-
-    for itinerary in itineraries:
-        segments = itinerary.get('segments', [])
-        for seg in segments:
-            dep_code = seg['departure']['iataCode']  
-            dep_time_str = seg['departure']['at']
-            arr_code = seg['arrival']['iataCode']
-            arr_time_str = seg['arrival']['at']
-
-            dep_dt = parser.parse(dep_time_str)
-            dep_date = dep_dt.strftime("%B %d, %Y")
-            dep_time = dep_dt.strftime("%I:%M %p")
-
-            arr_dt = parser.parse(arr_time_str)
-            arr_date = arr_dt.strftime("%B %d, %Y")
-            arr_time = arr_dt.strftime("%I:%M %p")
-
-            # Convert IATA->City using airportsdata
-            dep_city_name = iata_to_city_name(dep_code)
-            arr_city_name = iata_to_city_name(arr_code)
-
-            summary_lines.append(f"Segment {segment_counter}:")
-            summary_lines.append(f"  From: {dep_city_name} ({dep_code})")
-            summary_lines.append(f"  Date: {dep_date}")
-            summary_lines.append(f"  Time: {dep_time}\n")
-
-            summary_lines.append(f"  To: {arr_city_name} ({arr_code})")
-            summary_lines.append(f"  Date: {arr_date}")
-            summary_lines.append(f"  Time: {arr_time}\n")
+    all_segments = [seg for itinerary in itineraries for seg in itinerary.get('segments', [])]
+
+    # Convert IATA->City using airportsdata
+    segments_text = [
+        SEGMENT_TEMPLATE.format(
+            idx=i,
+            dep_city=iata_to_city_name(seg['departure']['iataCode']),
+            dep_code=seg['departure']['iataCode'],
+            dep_dt=datetime.fromisoformat(seg['departure']['at']),
+            arr_city=iata_to_city_name(seg['arrival']['iataCode']),
+            arr_code=seg['arrival']['iataCode'],
+            arr_dt=datetime.fromisoformat(seg['arrival']['at']),
+        )
+        for i, seg in enumerate(all_segments, start=1)
+    ]
 
-            segment_counter += 1
+    return "\n".join([FLIGHT_HEADER_TEMPLATE.format(total_price=total_price)] + segments_text)
 
-    return "\n".join(summary_lines)
+def json_schema_format(name, schema):
+    """
+    response_format that makes GPT reply with JSON matching 'schema' (strict structured output).
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": schema},
+    }
+
+HOTELS_RESPONSE_FORMAT = json_schema_format("hotels", {
+    "type": "object",
+    "properties": {
+        "hotels": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "price": {"type": "string"},
+                    "address": {"type": "string"},
+                },
+                "required": ["name", "price", "address"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["hotels"],
+    "additionalProperties": False,
+})
+
+HOTEL_DESCRIPTIONS_RESPONSE_FORMAT = json_schema_format("hotel_descriptions", {
+    "type": "object",
+    "properties": {
+        "descriptions": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["descriptions"],
+    "additionalProperties": False,
+})
 
 def get_gpt_hotels(destination, budget_per_night):
     """
@@ -165,55 +449,78 @@ def get_gpt_hotels(destination, budget_per_night):
     user_prompt = (
         f"Recommend exactly 5 real hotels in {destination} that typically have an average "
         f"nightly rate at or under ${budget_per_night:.2f} USD. "
-        "Only provide valid JSON—no code fences or extra text. The response must look like:\n"
-        "[\n"
-        "  {\n"
-        '    \"name\": \"Hotel Name\",\n'
-        '    \"price\": \"Approx. 120\",\n'
-        '    \"address\": \"123 Street, City\"\n'
-        "  },\n"
-        "  ... (5 total) ...\n"
-        "]"
+        "Put them in the 'hotels' list, giving each hotel's name, approximate nightly price "
+        "(e.g. \"Approx. 120\") and street address."
     )
 
-    response = ask_openai(user_prompt)
-    response_stripped = response.strip().strip("```").strip()
-    try:
-        hotel_list = json.loads(response_stripped)
-        if isinstance(hotel_list, list) and len(hotel_list) == 5:
-            return hotel_list
-        else:
-            print("GPT did not return a list of exactly 5 hotels.")
-            return []
-    except Exception as e:
-        print("Failed to parse GPT hotel data as JSON:", e)
-        print("GPT Response was:", response)
+    reply = ask_openai_json(user_prompt, max_tokens=300, response_format=HOTELS_RESPONSE_FORMAT)
+    if reply is None:
         return []
+    hotel_list = reply.get("hotels", [])
+    if len(hotel_list) == 5:
+        return hotel_list
+    print("GPT did not return a list of exactly 5 hotels.")
+    return []
 
-def generate_hotel_description(hotel_name, city, address, approx_price):
+hotel_description_cache = {}             # (name, city, address, price) -> description
+
+def request_hotel_descriptions(hotel_keys, city):
     """
-    GPT short description for each hotel.
+    GPT short description for every (name, city, address, price) key, requested in a single call.
+    Returns a list of descriptions in the same order, or None if the reply can't be used.
     """
+    hotel_lines = "\n".join(
+        json.dumps({"name": name, "address": address, "price": price})
+        for name, _, address, price in hotel_keys
+    )
     prompt = (
-        f"Write a short, engaging description for a hotel named '{hotel_name}' located in {city}. "
-        f"The approximate nightly rate is {approx_price}. Its address is: {address}. "
-        "Highlight proximity to popular landmarks or city centers, and the general vibe."
+        f"For each of the following hotels located in {city}, write a short, engaging description "
+        "of at most 2 sentences (about 50 words). "
+        "Highlight proximity to popular landmarks or city centers, and the general vibe.\n"
+        f"{hotel_lines}\n"
+        f"Put exactly {len(hotel_keys)} descriptions in the 'descriptions' list, "
+        "one per hotel, in the same order as listed above."
     )
-    return ask_openai(prompt)
+
+    # 200 tokens per description leaves ample headroom over the ~50-word limit
+    reply = ask_openai_json(prompt, max_tokens=200 * len(hotel_keys), response_format=HOTEL_DESCRIPTIONS_RESPONSE_FORMAT)
+    if reply is None:
+        return None
+    descriptions = reply.get("descriptions", [])
+    if len(descriptions) == len(hotel_keys):
+        return descriptions
+    print(f"GPT did not return a list of exactly {len(hotel_keys)} descriptions.")
+    return None
+
+def generate_hotel_descriptions(hotels, city):
+    """
+    Short description for each hotel, in the same order as 'hotels'.
+    Cached per (name, city, address, price) so re-submitting only asks GPT about new hotels.
+    """
+    keys = [
+        (h.get("name", "Unknown Hotel"), city, h.get("address", "N/A"), h.get("price", "N/A"))
+        for h in hotels
+    ]
+    missing = [key for key in dict.fromkeys(keys) if key not in hotel_description_cache]
+    if missing:
+        descriptions = request_hotel_descriptions(missing, city)
+        if descriptions:
+            hotel_description_cache.update(zip(missing, descriptions))
+    return [hotel_description_cache.get(key, "N/A") for key in keys]
 
 def parse_gpt_hotels(hotels):
     """
     For each GPT-provided hotel, generate a short description. Return combined text.
     """
+    city_guess = "the destination"
+    descriptions = generate_hotel_descriptions(hotels, city_guess)
+
     summaries = []
-    for i, h in enumerate(hotels, start=1):
+    for i, (h, description) in enumerate(zip(hotels, descriptions), start=1):
         name = h.get("name", "Unknown Hotel")
         price = h.get("price", "N/A")
         address = h.get("address", "N/A")
 
-        city_guess = "the destination"
-        description = generate_hotel_description(name, city_guess, address, price)
-
         summary = (
             f"Hotel Option #{i}\n"
             f"Name: {name}\n"
@@ -268,6 +575,9 @@ class TravelPlannerGUI:
         self.activities_info = ""
         self.final_summary = ""
 
+        # Worker threads for network calls so the Tk mainloop never blocks
+        self.executor = ThreadPoolExecutor(max_workers=4)
+
         # Main container
         self.main_container = ttk.Frame(self.root, padding="10 10 10 10")
         self.main_container.grid(row=0, column=0, sticky="nsew")
@@ -277,6 +587,53 @@ class TravelPlannerGUI:
 
         self.create_input_frame()
 
+    def run_in_background(self, on_done, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) on the worker pool, then call on_done(result) on the Tk thread.
+        """
+        future = self.executor.submit(func, *args, **kwargs)
+        self.root.after(50, self._poll_future, future, on_done)
+
+    def _poll_future(self, future, on_done):
+        """
+        Re-schedule itself via root.after until the future finishes.
+        """
+        if not future.done():
+            self.root.after(50, self._poll_future, future, on_done)
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            # Unexpected worker failure (e.g. a malformed API payload): let the user try again
+            self.hide_busy()
+            messagebox.showerror("Error", f"Something went wrong: {e}")
+            return
+        on_done(result)
+
+    def show_busy(self, parent, row, message, button=None):
+        """
+        Put a label and a running indeterminate progress bar at 'row' of 'parent',
+        and disable 'button' (if given) until hide_busy() is called.
+        """
+        self.busy_button = button
+        if button is not None:
+            button.config(state="disabled")
+
+        self.busy_frame = ttk.Frame(parent)
+        self.busy_frame.grid(row=row, column=0, columnspan=2, pady=5)
+        ttk.Label(self.busy_frame, text=message).grid(row=0, column=0, padx=5)
+        progress = ttk.Progressbar(self.busy_frame, mode="indeterminate", length=200)
+        progress.grid(row=0, column=1, padx=5)
+        progress.start(10)
+
+    def hide_busy(self):
+        """
+        Remove the progress indicator from show_busy() and re-enable its button.
+        """
+        self.busy_frame.destroy()
+        if self.busy_button is not None and self.busy_button.winfo_exists():
+            self.busy_button.config(state="normal")
+
     def create_input_frame(self):
         """
         First screen: departure/destination, dates, budget
@@ -303,13 +660,13 @@ class TravelPlannerGUI:
         ttk.Label(self.input_frame, text="Hotel budget (per night):").grid(row=4, column=0, sticky="w")
         ttk.Entry(self.input_frame, textvariable=self.budget_var, width=40).grid(row=4, column=1, sticky="ew", padx=5, pady=5)
 
-        submit_button = ttk.Button(
+        self.submit_button = ttk.Button(
             self.input_frame,
             text="Submit",
             command=self.handle_travel_info,
             style="Modern.TButton"
         )
-        submit_button.grid(row=5, column=0, columnspan=2, pady=10)
+        self.submit_button.grid(row=5, column=0, columnspan=2, pady=10)
 
         self.input_frame.columnconfigure(1, weight=1)
 
@@ -336,27 +693,57 @@ class TravelPlannerGUI:
             messagebox.showerror("Error", "Please fill in departure, destination, and start/end dates.")
             return
 
-        origin_iata = get_iata_code(departure_city)
-        dest_iata = get_iata_code(destination_city)
-        if not origin_iata:
-            messagebox.showerror("Error", f"Could not find IATA code for departure: {departure_city}")
-            return
-        if not dest_iata:
-            messagebox.showerror("Error", f"Could not find IATA code for destination: {destination_city}")
-            return
+        self.show_busy(self.input_frame, 6, "Searching flights and hotels...", self.submit_button)
+        self.run_in_background(
+            self._on_travel_work_done,
+            self._do_travel_work,
+            departure_city, destination_city, start_date, end_date, budget_per_night,
+        )
 
-        # 1) Flight
-        flight_data = get_flights(origin_iata, dest_iata, start_date, end_date)
-        self.single_flight_info = parse_single_flight_offer(flight_data)
+    def _do_travel_work(self, departure_city, destination_city, start_date, end_date, budget_per_night):
+        """
+        Worker-thread part of handle_travel_info: IATA lookups, flight search and GPT hotels.
+        Returns (error_message, flight_info, hotels, hotel_summaries); error_message is None on success.
+        """
+        # The fan-out gets its own short-lived pool: blocking on children submitted
+        # to self.executor from one of its own workers could deadlock it
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            # The two IATA lookups are independent of each other
+            origin_future = pool.submit(get_iata_code, departure_city)
+            dest_future = pool.submit(get_iata_code, destination_city)
+            origin_iata = origin_future.result()
+            dest_iata = dest_future.result()
+            if not origin_iata:
+                return f"Could not find IATA code for departure: {departure_city}", None, None, None
+            if not dest_iata:
+                return f"Could not find IATA code for destination: {destination_city}", None, None, None
+
+            # 1) Flight and 2) GPT hotels don't depend on each other either
+            flight_future = pool.submit(get_flights, origin_iata, dest_iata, start_date, end_date)
+            hotels_future = pool.submit(get_gpt_hotels, destination_city, budget_per_night)
+            flight_info = parse_single_flight_offer(flight_future.result())
+            hotels = hotels_future.result()
 
-        # 2) GPT hotels
-        hotels = get_gpt_hotels(destination_city, budget_per_night)
-        self.hotel_offers = hotels
         if not hotels:
-            self.hotel_summaries = "No hotels found by GPT or an error occurred."
+            hotel_summaries = "No hotels found by GPT or an error occurred."
         else:
-            parsed_hotels = parse_gpt_hotels(hotels)
-            self.hotel_summaries = "\n".join(parsed_hotels)
+            hotel_summaries = "\n".join(parse_gpt_hotels(hotels))
+
+        return None, flight_info, hotels, hotel_summaries
+
+    def _on_travel_work_done(self, result):
+        """
+        Back on the Tk thread: show an error, or store the results and move to the next frame.
+        """
+        error_message, flight_info, hotels, hotel_summaries = result
+        if error_message:
+            self.hide_busy()
+            messagebox.showerror("Error", error_message)
+            return
+
+        self.single_flight_info = flight_info
+        self.hotel_offers = hotels
+        self.hotel_summaries = hotel_summaries
 
         self.input_frame.destroy()
         self.create_flight_hotel_frame()
@@ -446,13 +833,13 @@ class TravelPlannerGUI:
         ttk.Label(self.interests_frame, text="What kind of food do you like? (e.g., seafood, vegetarian)").grid(row=1, column=0, sticky="w")
         ttk.Entry(self.interests_frame, textvariable=self.food_interests, width=40).grid(row=1, column=1, sticky="ew", padx=5, pady=5)
 
-        next_button = ttk.Button(
+        self.activities_button = ttk.Button(
             self.interests_frame,
             text="Show Activities",
             command=self.get_activities,
             style="Modern.TButton"
         )
-        next_button.grid(row=2, column=0, columnspan=2, pady=10)
+        self.activities_button.grid(row=2, column=0, columnspan=2, pady=10)
 
         self.interests_frame.columnconfigure(1, weight=1)
 
@@ -472,8 +859,8 @@ class TravelPlannerGUI:
         chosen_hotel = self.selected_hotel.get().strip()
 
         try:
-            start_dt = parser.parse(start_date_str)
-            end_dt = parser.parse(end_date_str)
+            start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")
+            end_dt = datetime.strptime(end_date_str, "%Y-%m-%d")
             total_days = (end_dt - start_dt).days + 1
             if total_days < 1:
                 messagebox.showerror("Error", "Your end date must be after your start date.")
@@ -491,7 +878,11 @@ class TravelPlannerGUI:
             "Focus on attractions and food options that match my preferences."
         )
 
-        self.activities_info = ask_openai(prompt)
+        self.show_busy(self.interests_frame, 3, "Planning your itinerary...", self.activities_button)
+        self.run_in_background(self._on_activities_done, ask_openai, prompt)
+
+    def _on_activities_done(self, activities_info):
+        self.activities_info = activities_info
 
         self.interests_frame.destroy()
         self.create_final_summary_frame()
@@ -519,22 +910,19 @@ class TravelPlannerGUI:
             "Please format it nicely for the user, but do not ask for more data."
         )
 
-        self.final_summary = ask_openai(summary_prompt)
-
         ttk.Label(self.summary_frame, text="Your Final Trip Summary:").grid(row=0, column=0, sticky="w")
 
         # Add a scrollable text box
         summary_text_frame = ttk.Frame(self.summary_frame)
         summary_text_frame.grid(row=1, column=0, sticky="nsew", pady=5)
 
-        text_box = tk.Text(summary_text_frame, wrap="word")
-        text_box.grid(row=0, column=0, sticky="nsew")
-        text_box.insert("1.0", self.final_summary)
-        text_box.config(state="disabled")
+        self.summary_text_box = tk.Text(summary_text_frame, wrap="word")
+        self.summary_text_box.grid(row=0, column=0, sticky="nsew")
+        self.summary_text_box.config(state="disabled")
 
-        summary_scrollbar = ttk.Scrollbar(summary_text_frame, orient="vertical", command=text_box.yview)
+        summary_scrollbar = ttk.Scrollbar(summary_text_frame, orient="vertical", command=self.summary_text_box.yview)
         summary_scrollbar.grid(row=0, column=1, sticky="ns")
-        text_box["yscrollcommand"] = summary_scrollbar.set
+        self.summary_text_box["yscrollcommand"] = summary_scrollbar.set
 
         summary_text_frame.rowconfigure(0, weight=1)
         summary_text_frame.columnconfigure(0, weight=1)
@@ -544,6 +932,36 @@ class TravelPlannerGUI:
         self.summary_frame.rowconfigure(1, weight=1)
         self.summary_frame.columnconfigure(0, weight=1)
 
+        self.show_busy(self.summary_frame, 3, "Writing your trip summary...")
+        self.run_in_background(self._on_summary_done, ask_openai, summary_prompt, stream_cb=self._stream_summary_text)
+
+    def _stream_summary_text(self, text):
+        """
+        Called from the event-loop thread for each streamed piece; hands it to Tk via root.after.
+        """
+        self.root.after(0, self._append_summary_text, text)
+
+    def _append_summary_text(self, text):
+        self.summary_text_box.config(state="normal")
+        self.summary_text_box.insert("end", text)
+        self.summary_text_box.config(state="disabled")
+
+    def _on_summary_done(self, final_summary):
+        # Pieces still queued by _stream_summary_text were scheduled before the call
+        # finished, so going through the same after() queue runs this after all of them
+        self.root.after(0, self._finish_summary, final_summary)
+
+    def _finish_summary(self, final_summary):
+        self.final_summary = final_summary
+        self.hide_busy()
+
+        # Only rewrite the box if the streamed text isn't the result, e.g. on an error message
+        if self.summary_text_box.get("1.0", "end-1c") != self.final_summary:
+            self.summary_text_box.config(state="normal")
+            self.summary_text_box.delete("1.0", "end")
+            self.summary_text_box.insert("1.0", self.final_summary)
+            self.summary_text_box.config(state="disabled")
+
 def main():
     root = tk.Tk()
     app = TravelPlannerGUI(root)